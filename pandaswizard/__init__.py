@@ -19,13 +19,31 @@
 # ? https://python-semver.readthedocs.io/en/latest/advanced/convert-pypi-to-semver.html
 __version__ = "1.1.0"
 
+import importlib
+
 # init-time options registrations
 from pandaswizard.aggregate import (
     quantile,
-    percentile
+    percentile,
+    percentiles,
+    grouped_quantile,
+    grouped_percentile,
+    frame_percentiles,
+    agg_quantiles
 )
 
-from pandaswizard import window
-from pandaswizard import wrappers
-from pandaswizard import functions
-from pandaswizard import timeseries
+# ? submodules are imported on first access, https://peps.python.org/pep-0562/
+# this avoids importing optional dependencies (like statsmodels) on init
+__LAZY_SUBMODULES__ = ("window", "wrappers", "functions", "timeseries")
+
+def __getattr__(name : str) -> object:
+    if name in __LAZY_SUBMODULES__:
+        module = importlib.import_module(f"pandaswizard.{name}")
+        globals()[name] = module # ? cache, __getattr__ is not called again
+        return module
+
+    raise AttributeError(f"module 'pandaswizard' has no attribute '{name}'")
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(__LAZY_SUBMODULES__))
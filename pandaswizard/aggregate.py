@@ -9,9 +9,13 @@
 """
 
 import warnings
+import functools
 import numpy as np
 import pandas as pd
 
+from typing import Iterable
+
+
 def __set_method__(kwargs : dict) -> str:
     """
     Set "Method"/"Interpolation" Attribute for Aggregated Function(s)
@@ -21,7 +25,7 @@ def __set_method__(kwargs : dict) -> str:
     :func:`quantile` methods defined below.
     """
 
-    assert not all(["method" in kwargs, "interpolation" in kwargs]), \
+    assert not ("method" in kwargs and "interpolation" in kwargs), \
         "Either `method` or `interpolation` is required. Received both."
 
     method = kwargs.get("method", kwargs.get("interpolation", "linear"))
@@ -36,66 +40,131 @@ def __set_basemod__(basemod : str) -> str:
     return basemod
 
 
-def __calculate_quantile__(
-            x : pd.Series,
-            n : float,
-            method : str,
-            func : str,
-            dropna : bool,
-            basemod : str
-    ) -> float:
+def __set_attributes__(kwargs : dict) -> tuple:
+    """
+    Resolve the Keyword Arguments of the Aggregated Function(s)
+
+    The `kwargs` of :func:`percentile` and :func:`quantile` are
+    validated and resolved at once into `(method, dropna, basemod)`
+    which is also the key of the cached aggregate function.
+    """
+
+    method = __set_method__(kwargs)
+    dropna = kwargs.get("dropna", True)
+    basemod = __set_basemod__(kwargs.get("basemod", "pandas"))
+
+    return method, dropna, basemod
+
+
+# ? `interpolation` of `pd.Series.quantile`, same as `method` of `np.quantile`
+__PD_INTERPOLATION__ = ("linear", "lower", "higher", "midpoint", "nearest")
+
+
+def __is_fast_quantile__(x : pd.Series, method : str) -> bool:
     """
-    Calculates Percentile/Quantile for a Grouped Series
+    Check if `pd.Series.quantile` can be Computed using `np.quantile`
+
+    The numpy function is directly called on the underlying array
+    for a numeric series, while other data types (like datetime) and
+    the extension data types (like `Int64`) are always calculated
+    using the `pandas` module.
+    """
+
+    return method in __PD_INTERPOLATION__ \
+        and isinstance(x.dtype, np.dtype) and x.dtype.kind in "iuf"
+
+
+# ? numpy function to calculate the `func` w/ or w/o `dropna` for basemod = "np"
+__FUNC_DISPATCHER__ = {
+    "percentile" : {
+        True : np.nanpercentile,
+        False : np.percentile
+    },
+    "quantile" : {
+        True : np.nanquantile,
+        False : np.quantile
+    }
+}
+
+# ? keyword for the interpolation method, renamed in numpy v1.22.0
+# https://github.com/numpy/numpy/issues/21283, resolved on import
+__NP_METHOD_KEYWORD__ = "method" \
+    if np.lib.NumpyVersion(np.__version__) >= "1.22.0" else "interpolation"
+
+
+def __calculate_quantile__(n : float, method : str, func : str, dropna : bool, basemod : str) -> callable:
+    """
+    Returns a Function to Calculate Percentile/Quantile for a Series
 
     The function can calculate both percentile and/or quantile, but
     name is set as `__calculate_quantile__()` as default. Uses either
-    the `numpy` or the `pandas` module to calculate the result.
+    the `numpy` or the `pandas` module to calculate the result. All
+    the attributes are resolved once, and the returned function is
+    specialized such that the dispatch is not done for each group.
+    The `basemod` is expected to be resolved by :func:`__set_basemod__`
+    and `n` is always a fraction, i.e., `n ∈ [0, 1]`.
     """
 
-    retval = None # ? return value, i.e., quantile/percentile
-    basemod = __set_basemod__(basemod) # ? defaults to pd (pandas)
-
     if basemod == "pd":
-        # ? use pandas to calculate the series quantile/percentile
-        # this is the default feature, and mimics np.nanquantile
-        retval = x.quantile(n, interpolation = method)
+        def calculate_(x : pd.Series) -> float:
+            if __is_fast_quantile__(x, method):
+                # ? same as `x.quantile()` but w/o the per-call pandas overhead
+                # nan values are dropped which mimics the `pd.Series.quantile`
+                values = x.to_numpy() # ? integer array cannot have nan values
+                if values.dtype.kind == "f":
+                    values = values[~np.isnan(values)]
+
+                return np.quantile(values, n, **{__NP_METHOD_KEYWORD__ : method}) if values.size else np.nan
+
+            # ? use pandas to calculate the series quantile/percentile
+            # this is the default feature, and mimics np.nanquantile
+            return x.quantile(n, interpolation = method)
+
+        return calculate_
+
+    # ? else use numpy to calculate series quantile/percentile
+    # ! this is always true, asserted in `__set_basemod__()` on init
+    n = n * 100 if func == "percentile" else n
+
+    if __NP_METHOD_KEYWORD__ == "interpolation":
+        __ref_issue = "https://github.com/numpy/numpy/issues/21283"
+        warnings.warn(f"NumPy/np Version < 1.22, {__ref_issue}", FutureWarning)
+
+    qfunc = functools.partial(
+        __FUNC_DISPATCHER__[func][dropna], q = n, **{__NP_METHOD_KEYWORD__ : method}
+    )
+
+    def calculate_(x : pd.Series) -> float:
+        if isinstance(x.dtype, np.dtype):
+            return qfunc(x.to_numpy()) # ? the underlying array, w/o copy
+
+        # ! extension types (like `Int64`) are converted to float array
+        return qfunc(x.to_numpy(dtype = np.float64, na_value = np.nan))
+
+    return calculate_
+
+
+@functools.lru_cache(maxsize = 256)
+def __quantile_closure__(n : float, outname : str, method : str, dropna : bool, basemod : str, func : str) -> callable:
+    """
+    Create (or Reuse) the Aggregate Function for :func:`percentile`
+    and :func:`quantile`
+
+    The closure is cached on the resolved arguments, such that the
+    same function object is returned for repeated calls and is not
+    recreated each time the aggregation is defined. The `n` is the
+    same as received by the caller, i.e., percentage for `func` as
+    "percentile" else a fraction.
+    """
+
+    if func == "percentile":
+        qfunc = __calculate_quantile__(n / 100, method = method, func = func, dropna = dropna, basemod = basemod)
+        qfunc.__name__ = outname or f"P{n:.2f}"
     else:
-        # ? else use numpy to calculate series quantile/percentile
-        # ! this is always true, asserted in `__set_basemod__()`
-        x = x.values # ? convert to an np.ndarray
-        n = n * 100 if func == "percentile" else n
-
-        __func_dispatcher__ = {
-            "percentile" : {
-                True : np.nanpercentile,
-                False : np.percentile
-            },
-            "quantile" : {
-                True : np.nanquantile,
-                False : np.quantile
-            }
-        }
-
-        try:
-            retval = __func_dispatcher__[func][dropna](x, n, method = method)
-        except TypeError as err:
-            __ref_issue = "https://github.com/numpy/numpy/issues/21283"
-            warnings.warn(
-                f"NumPy/np Version < 1.22, {__ref_issue} Error: {err}",
-                FutureWarning
-            )
-
-            # ? for older version, try with attribute `interpolation`, else
-            # ! this should not raise error, unless legacy numpy version, OR
-            # method/interpolation value is given for a newer version, not available
-            try:
-                retval = __func_dispatcher__[func][dropna](x, n, interpolation = method)
-            except Exception as err:
-                __warn_message = f"Cannot call attribute `method/interpolation` = {err}"
-                warnings.warn(f"{__warn_message}. Returning value w/o argument", SyntaxWarning)
-                retval = __func_dispatcher__[func][dropna](x, n)
+        qfunc = __calculate_quantile__(n, method = method, func = func, dropna = dropna, basemod = basemod)
+        qfunc.__name__ = outname or f"Q{n * 100:.2f}"
 
-    return retval
+    return qfunc
 
 
 def percentile(n : float, outname : str = None, **kwargs) -> float:
@@ -183,20 +252,15 @@ def percentile(n : float, outname : str = None, **kwargs) -> float:
     In **CASE-I** the argument "outname" does not have any implications
     as `pandas` by default returns using the result with the original
     name, however in case of **CASE-II** we can set the feature name
-    using the argument `outname`.
+    using the argument `outname`. For **CASE-I** the function
+    :func:`grouped_percentile` is faster, as all the groups are
+    calculated at once by `pandas`.
     """
 
-    method = __set_method__(kwargs)
-
-    # ? the validation and check are done in __calculate_quantile__()
-    dropna = kwargs.get("dropna", True)
-    basemod = kwargs.get("basemod", "pandas")
-
-    def percentile_(x : list) -> float:
-        return __calculate_quantile__(x, n = n / 100, method = method, func = "percentile", dropna = dropna, basemod = basemod)
+    # ? validate and resolve once, not for each of the group
+    method, dropna, basemod = __set_attributes__(kwargs)
 
-    percentile_.__name__ = outname or f"P{n:.2f}"
-    return percentile_
+    return __quantile_closure__(n, outname, method, dropna, basemod, "percentile")
 
 
 def quantile(n : float, outname : str = None, **kwargs) -> float:
@@ -282,17 +346,438 @@ def quantile(n : float, outname : str = None, **kwargs) -> float:
     In **CASE-I** the argument "outname" does not have any implications
     as `pandas` by default returns using the result with the original
     name, however in case of **CASE-II** we can set the feature name
-    using the argument `outname`.
+    using the argument `outname`. For **CASE-I** the function
+    :func:`grouped_quantile` is faster, as all the groups are
+    calculated at once by `pandas`.
     """
 
-    method = __set_method__(kwargs)
+    # ? validate and resolve once, not for each of the group
+    method, dropna, basemod = __set_attributes__(kwargs)
+
+    return __quantile_closure__(n, outname, method, dropna, basemod, "quantile")
+
+
+def percentiles(n : Iterable[float], outnames : Iterable[str] = None, **kwargs) -> callable:
+    """
+    Compute Multiple Percentiles for the Grouped Data Series at Once
+
+    The function :func:`percentile` calculates a single value, and
+    thus the values of a group are sorted for each of the percentile
+    when used like `.agg([pdw.percentile(25), pdw.percentile(75)])`.
+    The returned function calculates all the percentiles using one
+    call of `np.quantile` and returns a `pd.Series` which is expanded
+    into the columns using :meth:`GroupBy.apply` as below.
+
+    :type  n: iterable
+    :param n: Percentage values to compute. Values must be between
+        `[0, 100]` both inclusive.
+
+    :type  outnames: iterable
+    :param outnames: Output names of the percentiles, which defaults
+        to :attr:`f"P{n:.2f}"` for each of the value as in
+        :func:`percentile` function.
+
+    Keyword Arguments
+    -----------------
+        * **method** (*str*): This parameter specifies the method to
+            use for estimating the percentile. Accepts any value as in
+            :meth:`np.percentile` and defaults to "linear" method.
+
+        * **interpolation** (*str*): Same as :attr:`method`, both
+            the attribute cannot be passed at the same time.
+
+        * **dropna** (*bool*): Calculate the percentile by dropping
+            the `nan` values (default), else returns `nan` if the
+            group has any `nan` values.
+
+    Example and Usages
+    ------------------
+
+    .. code-block:: python
+
+        import pandas as pd
+        import pandaswizard as pdw
+
+        data = pd.DataFrame({"G" : ["A", "B", "B"], "V" : [1, 2, 3]})
 
-    # ? the validation and check are done in __calculate_quantile__()
+        # ! `.agg()` expects a scalar, thus use `.apply()` and `.unstack()`
+        percentiles = data.groupby("G")["V"].apply(pdw.percentiles([25, 50, 75])).unstack()
+    """
+
+    method = __set_method__(kwargs)
     dropna = kwargs.get("dropna", True)
-    basemod = kwargs.get("basemod", "pandas")
 
-    def quantile_(x : list) -> float:
-        return __calculate_quantile__(x, n = n, method = method, func = "quantile", dropna = dropna, basemod = basemod)
+    n = np.asarray(n, dtype = np.float64)
+    index = pd.Index(outnames or [f"P{n_:.2f}" for n_ in n])
+
+    qfunc = np.nanquantile if dropna else np.quantile
+
+    def percentiles_(x : pd.Series) -> pd.Series:
+        values = x.to_numpy(dtype = np.float64, na_value = np.nan)
+        return pd.Series(qfunc(values, n / 100, **{__NP_METHOD_KEYWORD__ : method}), index = index)
+
+    return percentiles_
+
+
+def grouped_quantile(groupby : object, n : float, **kwargs) -> object:
+    """
+    Compute the n-th Quantile for all the Groups in a Single Call
+
+    The functions :func:`percentile` and :func:`quantile` returns a
+    closure which is called by `pandas` once for each of the group,
+    which is required when used in conjuncture with other functions
+    (CASE-II). However, for a standalone usage (CASE-I) the grouped
+    object can directly call the :meth:`GroupBy.quantile` method
+    that computes the result for all the groups at once, and is
+    much faster when the number of groups is large.
+
+    :type  groupby: pd.core.groupby.GroupBy
+    :param groupby: The grouped object, typically created using the
+        :meth:`pd.DataFrame.groupby` method. The selection of the
+        feature(s) can be done before passing the object.
+
+    :type  n: int or float
+    :param n: Probability value for the quantiles to compute. The
+        values must be between `[0, 1]` both inclusive.
+
+    Keyword Arguments
+    -----------------
+        * **method** (*str*): Method for quantile calculation as
+            defined in :meth:`GroupBy.quantile` and the values can be:
+            {'linear', 'lower', 'higher', 'midpoint', 'nearest'}.
+
+        * **interpolation** (*str*): Same as :attr:`method`, both
+            the attribute cannot be passed at the same time.
+
+    Example and Usages
+    ------------------
+
+    .. code-block:: python
+
+        import pandas as pd
+        import pandaswizard as pdw
+
+        data = pd.DataFrame({"G" : ["A", "B", "B"], "V" : [1, 2, 3]})
+
+        # CASE-I: equivalent to `data.groupby("G").agg({"V" : pdw.quantile(0.5)})`
+        quantile = pdw.grouped_quantile(data.groupby("G")[["V"]], 0.5)
+    """
+
+    method = __set_method__(kwargs)
+    return groupby.quantile(q = n, interpolation = method)
+
+
+def grouped_percentile(groupby : object, n : float, **kwargs) -> object:
+    """
+    Compute the n-th Percentile for all the Groups in a Single Call
+
+    The function is the percentile equivalent of the function
+    :func:`grouped_quantile` and is the faster alternative to the
+    :func:`percentile` for a standalone usage (CASE-I).
+
+    :type  groupby: pd.core.groupby.GroupBy
+    :param groupby: The grouped object, typically created using the
+        :meth:`pd.DataFrame.groupby` method. The selection of the
+        feature(s) can be done before passing the object.
+
+    :type  n: int or float
+    :param n: Percentage value to compute. Values must be between
+        `[0, 100]` both inclusive.
+
+    Keyword Arguments
+    -----------------
+        * **method** (*str*): Method for percentile calculation as
+            defined in :func:`grouped_quantile`.
+
+        * **interpolation** (*str*): Same as :attr:`method`, both
+            the attribute cannot be passed at the same time.
+
+    Example and Usages
+    ------------------
+
+    .. code-block:: python
+
+        import pandas as pd
+        import pandaswizard as pdw
+
+        data = pd.DataFrame({"G" : ["A", "B", "B"], "V" : [1, 2, 3]})
+
+        # CASE-I: equivalent to `data.groupby("G").agg({"V" : pdw.percentile(50)})`
+        percentile = pdw.grouped_percentile(data.groupby("G")[["V"]], 50)
+    """
+
+    return grouped_quantile(groupby, n / 100, **kwargs)
+
+
+def __factorize_groups__(frame : pd.DataFrame, by : object) -> tuple:
+    """
+    Factorize the Grouping Feature(s) into Integer Codes
+
+    Returns the integer codes (`-1` for missing keys, which are
+    dropped as in :meth:`pd.DataFrame.groupby`) and the sorted unique
+    keys, which is used as the index of the grouped result.
+    """
+
+    if isinstance(by, (list, tuple)):
+        keys = frame[list(by)]
+        valid = keys.notna().all(axis = 1).to_numpy()
+        keys = pd.MultiIndex.from_frame(keys[valid])
+    else:
+        keys = frame[by]
+        valid = keys.notna().to_numpy()
+        keys = pd.Index(keys[valid], name = by)
+
+    codes = np.full(valid.shape[0], -1, dtype = np.intp)
+    codes[valid], uniques = keys.factorize(sort = True)
+    return codes, uniques.set_names(keys.names) # ? names are not retained
+
+
+def __sorted_group_quantile__(
+        codes : np.ndarray,
+        values : np.ndarray,
+        n_groups : int,
+        q : np.ndarray,
+        method : str
+    ) -> np.ndarray:
+    """
+    Calculate Quantile(s) for all the Groups using a Single Sort
+
+    The values are sorted within each of the group at once (`nan`
+    values and missing group keys are dropped), and the position of
+    each quantile is calculated and gathered for all the groups. The
+    interpolation `method` is same as in :meth:`pd.Series.quantile`.
+    The `q` must be in `[0, 1]`, else the values of the neighbouring
+    group are gathered. Returns an array of shape `(n_groups, len(q))`
+    which is `nan` for an empty group.
+    """
+
+    valid = (codes >= 0) & ~np.isnan(values)
+    codes, values = codes[valid], values[valid]
+
+    # ? same as `np.lexsort((values, codes))`, but the stable sort of
+    # integer codes (radix sort) after sorting the values is faster
+    order = np.argsort(values)
+    values = values[order[np.argsort(codes[order], kind = "stable")]]
+
+    counts = np.bincount(codes, minlength = n_groups)
+    starts = np.cumsum(counts) - counts
+
+    # ? virtual index of the quantile within each of the sorted group
+    position = q[np.newaxis, :] * (counts[:, np.newaxis] - 1)
+    if method == "nearest":
+        position = np.around(position)
+
+    lower = np.floor(position)
+    gamma = position - lower
+
+    empty = counts == 0 # ! position is negative for an empty group
+    index = starts[:, np.newaxis] + lower.astype(np.intp)
+    index[empty] = 0
+
+    below = values[np.minimum(index, values.size - 1)] if values.size else np.full(index.shape, np.nan)
+    above = values[np.minimum(index + (gamma > 0), values.size - 1)] if values.size else below
+
+    if method in ["lower", "nearest"]:
+        retval = below
+    elif method == "higher":
+        retval = above
+    elif method == "midpoint":
+        retval = (below + above) / 2
+    else:
+        # ? linear interpolation, same as the `_lerp()` of numpy
+        difference = above - below
+        retval = np.where(
+            gamma >= 0.5,
+            above - difference * (1 - gamma),
+            below + difference * gamma
+        )
+
+    retval[empty] = np.nan
+    return retval
+
+
+def __grouped_kernel_quantile__(
+        codes : np.ndarray,
+        values : np.ndarray,
+        n_groups : int,
+        q : np.ndarray,
+        method : str
+    ) -> np.ndarray:
+    """
+    Calculate Quantile(s) for all the Groups using a Compiled Kernel
+
+    Same as :func:`__sorted_group_quantile__` but the values are not
+    sorted all at once, instead the values are arranged on the groups
+    using counting sort and each of the group is sorted independently
+    by the compiled kernel. Falls back to :func:`__sorted_group_quantile__`
+    when the :mod:`numba` module is not available.
+    """
+
+    # ? the kernels (and numba) are only imported when the engine is used
+    from pandaswizard.utils._kernels import (
+        NUMBA_AVAILABLE, METHOD_CODE, _group_scatter_kernel, _group_quantile_kernel
+    )
+
+    if not NUMBA_AVAILABLE:
+        # ! the uncompiled kernel is slower than sorting all values at once
+        return __sorted_group_quantile__(codes, values, n_groups, q, method)
+
+    valid = (codes >= 0) & ~np.isnan(values)
+    codes, values = codes[valid], values[valid]
+
+    counts = np.bincount(codes, minlength = n_groups)
+    starts = np.cumsum(counts) - counts
+
+    values = _group_scatter_kernel(codes, values, starts)
+    return _group_quantile_kernel(values, starts, counts, q, METHOD_CODE[method])
+
+
+def frame_percentiles(frame : pd.DataFrame, by : object, feature : str, n : object, **kwargs) -> pd.DataFrame:
+    """
+    Compute the n-th Percentile(s) of a Feature for all the Groups
+
+    The function is an alternate to :func:`percentile` (CASE-I) that
+    does not call any function for each of the group, instead the
+    group keys are factorized, the values are sorted once within the
+    group and all the requested percentiles are gathered at once.
+    The approach is useful when the number of groups is large or
+    when multiple percentiles are required for the same feature.
+
+    :type  frame: pd.DataFrame
+    :param frame: The data frame object which contains both the
+        grouping feature(s) and the feature to be aggregated.
+
+    :type  by: str or list
+    :param by: The feature(s) used for grouping the data frame
+        object like :attr:`frame.groupby(by)` method. Missing keys
+        are dropped, and the result is sorted on the keys.
+
+    :type  feature: str
+    :param feature: A numeric feature for which the percentile(s)
+        is calculated, the `nan` values are always dropped.
+
+    :type  n: int or float or iterable
+    :param n: Percentage value(s) to compute. Values must be between
+        `[0, 100]` both inclusive.
+
+    Keyword Arguments
+    -----------------
+        * **method** (*str*): Method for percentile calculation as
+            defined in :meth:`pd.Series.quantile` and the values can
+            be: {'linear', 'lower', 'higher', 'midpoint', 'nearest'}.
+
+        * **interpolation** (*str*): Same as :attr:`method`, both
+            the attribute cannot be passed at the same time.
+
+        * **engine** (*str*): Either `numpy` (default) which sorts
+            all the values at once, or `numba` which sorts each of
+            the group independently using a compiled kernel, and
+            falls back to `numpy` when :mod:`numba` is not installed.
+
+    Example and Usages
+    ------------------
+
+    .. code-block:: python
+
+        import pandas as pd
+        import pandaswizard as pdw
+
+        data = pd.DataFrame({"G" : ["A", "B", "B"], "V" : [1, 2, 3]})
+        percentile = pdw.frame_percentiles(data, "G", "V", [25, 50, 75])
+
+    The returned data frame is indexed on the group keys and has one
+    column for each of the percentile named like :func:`percentile`
+    i.e., :attr:`f"P{n:.2f}"` and the values are always float.
+    """
+
+    method = __set_method__(kwargs)
+    assert method in __PD_INTERPOLATION__, \
+        f"method = {method} is not valid, and/or not implemented."
+
+    engine = kwargs.get("engine", "numpy")
+    assert engine in ["numpy", "numba"], \
+        f"engine = {engine} is not valid, and/or not implemented."
+
+    n = np.atleast_1d(np.asarray(n, dtype = np.float64))
+    assert ((n >= 0) & (n <= 100)).all(), \
+        f"n = {n} is not valid, percentiles must be between [0, 100]."
+
+    codes, uniques = __factorize_groups__(frame, by)
+
+    values = frame[feature].to_numpy(dtype = np.float64, na_value = np.nan)
+    calculate = __grouped_kernel_quantile__ if engine == "numba" else __sorted_group_quantile__
+    retval = calculate(codes, values, len(uniques), n / 100, method)
+
+    return pd.DataFrame(retval, index = uniques, columns = [f"P{n_:.2f}" for n_ in n])
+
+
+def agg_quantiles(frame : pd.DataFrame, by : object, spec : dict, **kwargs) -> pd.DataFrame:
+    """
+    Compute Quantile(s) of Multiple Features for all the Groups
+
+    The function is similar to `frame.groupby(by).agg(spec)` where
+    each of the function is a :func:`quantile`, however the group
+    keys are factorized only once and is shared between all the
+    features, and all the quantiles of a feature are calculated
+    at once as in :func:`frame_percentiles`.
+
+    :type  frame: pd.DataFrame
+    :param frame: The data frame object which contains both the
+        grouping feature(s) and the features to be aggregated.
+
+    :type  by: str or list
+    :param by: The feature(s) used for grouping the data frame
+        object like :attr:`frame.groupby(by)` method. Missing keys
+        are dropped, and the result is sorted on the keys.
+
+    :type  spec: dict
+    :param spec: A mapping of numeric feature to the probability
+        value(s) for the quantile to compute, the values must be
+        between `[0, 1]` both inclusive. For example,
+        :attr:`{"A" : 0.5, "B" : [0.25, 0.75]}`.
+
+    Keyword Arguments
+    -----------------
+        * **method** (*str*): Method for quantile calculation as
+            defined in :func:`frame_percentiles`.
+
+        * **interpolation** (*str*): Same as :attr:`method`, both
+            the attribute cannot be passed at the same time.
+
+        * **engine** (*str*): Either `numpy` (default) or `numba`,
+            check :func:`frame_percentiles` for more information.
+
+    The returned data frame is indexed on the group keys and has a
+    column for each of the feature and quantile, the column names
+    are like `(feature, f"Q{n * 100:.2f}")` as in :func:`quantile`.
+    """
+
+    assert spec, "`spec` must have at least one feature to aggregate."
+
+    method = __set_method__(kwargs)
+    assert method in __PD_INTERPOLATION__, \
+        f"method = {method} is not valid, and/or not implemented."
+
+    engine = kwargs.get("engine", "numpy")
+    assert engine in ["numpy", "numba"], \
+        f"engine = {engine} is not valid, and/or not implemented."
+
+    # ? the group keys are factorized once, and shared for all features
+    codes, uniques = __factorize_groups__(frame, by)
+    calculate = __grouped_kernel_quantile__ if engine == "numba" else __sorted_group_quantile__
+
+    retval, columns = [], []
+    for feature, n in spec.items():
+        n = np.atleast_1d(np.asarray(n, dtype = np.float64))
+        assert ((n >= 0) & (n <= 1)).all(), \
+            f"n = {n} of {feature} is not valid, quantiles must be between [0, 1]."
+
+        values = frame[feature].to_numpy(dtype = np.float64, na_value = np.nan)
+
+        retval.append(calculate(codes, values, len(uniques), n, method))
+        columns += [(feature, f"Q{n_ * 100:.2f}") for n_ in n]
 
-    quantile_.__name__ = outname or f"Q{n * 100:.2f}"
-    return quantile_
+    return pd.DataFrame(
+        np.hstack(retval), index = uniques,
+        columns = pd.MultiIndex.from_tuples(columns)
+    )
@@ -11,6 +11,8 @@
 import numpy as np
 from typing import Union, Callable
 
+from numpy.lib.stride_tricks import sliding_window_view
+
 def weightedMA(initial : float, rate : Union[float, Callable], length : int, decay : bool = True) -> np.ndarray:
     """
     Collate a Series based on Weighted Moving Average (WMA) Method
@@ -47,12 +49,47 @@ def weightedMA(initial : float, rate : Union[float, Callable], length : int, dec
         is given to the data which is older.
     """
 
-    factors = [initial] # append the initial values, and then calculate
-    for _ in range(length - 1):
-        factors.append(
-            rate(factors[-1]) if hasattr(rate, "__call__")
-            else factors[-1] / rate
-        )
+    if callable(rate):
+        # ? preallocate, and calculate the values from the initial value
+        factors = np.empty(max(length, 1), dtype = np.float64)
+
+        factors[0] = initial
+        for idx in range(1, length):
+            factors[idx] = rate(factors[idx - 1])
+    else:
+        # ? for a numeric rate the factors is a geometric series, i.e.,
+        # the n-th value is `initial / rate^n` which is vectorized, and
+        # like the callable rate has at least the initial value
+        factors = initial / np.power(float(rate), np.arange(max(length, 1), dtype = np.float64))
 
-    factors = np.array(factors)
     return factors[::-1] if decay else factors
+
+
+def simpleMA(series : Union[list, np.ndarray], window : int) -> np.ndarray:
+    """
+    Collate a Series based on Simple Moving Average (SMA) Method
+
+    SMA is the unweighted mean of the previous :attr:`window` data
+    points, and is calculated for all the complete windows of the
+    series. The function creates a view (w/o copying the data) of
+    shape `(len(series) - window + 1, window)` using the
+    :func:`np.lib.stride_tricks.sliding_window_view` and reduces the
+    same in one vectorized call.
+
+    .. code-block:: python
+
+        import pandaswizard as pdw
+        pdw.functions.simpleMA([12, 7, 27, 34], window = 2)
+        >> np.array([ 9.5, 17. , 30.5])
+
+    :type  series: iterable
+    :param series: A univariate series, i.e., an iterable or an
+        one-dimensional :attr:`numpy` array of numeric values.
+
+    :type  window: int
+    :param window: Length of the window, must be less than or equal
+        to the length of the series.
+    """
+
+    series = np.ascontiguousarray(series, dtype = np.float64)
+    return sliding_window_view(series, window).mean(axis = 1)
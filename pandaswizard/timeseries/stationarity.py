@@ -8,8 +8,10 @@
 (`More Information <http://ds-gringotts.readthedocs.io/>`_)
 """
 
-from statsmodels.tsa.stattools import kpss # kpss test
-from statsmodels.tsa.stattools import adfuller # adfuller test
+import warnings
+import numpy as np
+import pandas as pd
+
 
 def checkStationarity(frame : object, feature: str, method : str = "both", verbose : bool = True, **kwargs) -> bool:
     """
@@ -37,14 +39,52 @@ def checkStationarity(frame : object, feature: str, method : str = "both", verbo
     :param method: Select any of the method ['ADF', 'KPSS', 'both'],
                    using the `method` parameter, name is case
                    insensitive. Defaults to `both`.
+
+    Keyword Arguments
+    -----------------
+        * **window** (*int*): Window of the rolling mean and standard
+            deviation of the returned `rolling` dataframe, defaults
+            to `12` periods.
+
+        * **maxlag** (*int*): Maximum lag of the ADF test, passed to
+            :func:`adfuller`, defaults to `12 * (nobs / 100)^{1/4}`.
+
+        * **autolag** (*str*): Method to select the lag of the ADF
+            test, passed to :func:`adfuller` and defaults to `AIC`.
+            The lag selection fits a regression for each of the lag,
+            thus use `autolag = None` with a small `maxlag` (like 1)
+            for a faster test on a long series.
+
+        * **adf_lag** (*int*): A fixed lag of the ADF test, i.e., a
+            single regression is fitted w/o the lag selection, and is
+            same as `maxlag = adf_lag, autolag = None`.
+
+        * **kpss_nlags** (*str, int*): Number of lags of the KPSS test,
+            passed to :func:`kpss` as `nlags`, defaults to `auto`.
     """
 
+    # ? statsmodels is imported on call, the import is slow (~1 sec)
+    from statsmodels.tsa.stattools import kpss # kpss test
+    from statsmodels.tsa.stattools import adfuller # adfuller test
+    from statsmodels.tools.sm_exceptions import InterpolationWarning
+
     results = dict() # key is `ADF` and/or `KPSS`
     stationary = dict()
 
-    if method.upper() in ["ADF", "BOTH"]:
-        results["ADF"] = adfuller(frame[feature].values) # should be send like `frame.col.values`
-        stationary["ADF"] = True if (results["ADF"][1] <= 0.05) & (results["ADF"][4]["5%"] > results["ADF"][0]) else False
+    # ? the underlying array of the feature is created once, and is
+    # used for both the tests, the missing values are set as `nan`
+    values = np.ascontiguousarray(frame[feature].to_numpy(dtype = np.float64, na_value = np.nan))
+
+    method = method.upper() # ? name is case insensitive
+
+    if method in ["ADF", "BOTH"]:
+        if "adf_lag" in kwargs:
+            maxlag, autolag = kwargs["adf_lag"], None
+        else:
+            maxlag, autolag = kwargs.get("maxlag", None), kwargs.get("autolag", "AIC")
+
+        results["ADF"] = adfuller(values, maxlag = maxlag, autolag = autolag)
+        stationary["ADF"] = bool(results["ADF"][1] <= 0.05 and results["ADF"][4]["5%"] > results["ADF"][0])
 
         if verbose:
             print(f"Observations of ADF Test ({feature})")
@@ -56,11 +96,17 @@ def checkStationarity(frame : object, feature: str, method : str = "both", verbo
             print(f"Critical Values : {critical_values}")
 
         # always print if data is stationary/not
-        print(f"[ADF] Data is   :", "\u001b[32mStationary\u001b[0m" if stationary else "\x1b[31mNon-stationary\x1b[0m")
+        print(f"[ADF] Data is   :", "\u001b[32mStationary\u001b[0m" if stationary["ADF"] else "\x1b[31mNon-stationary\x1b[0m")
 
-    if method.upper() in ["KPSS", "BOTH"]:
-        results["KPSS"] = kpss(frame[feature].values) # should be send like `frame.col.values`
-        stationary["KPSS"] = False if (results["KPSS"][1] <= 0.05) & (results["KPSS"][3]["5%"] > results["KPSS"][0]) else True
+    if method in ["KPSS", "BOTH"]:
+        with warnings.catch_warnings():
+            # ? p-value is bounded by the look-up table, the statistics is
+            # compared against the critical values for the verdict
+            warnings.simplefilter("ignore", InterpolationWarning)
+            results["KPSS"] = kpss(values, nlags = kwargs.get("kpss_nlags", "auto"))
+
+        # ! null hypothesis of kpss is stationarity, rejected for a large statistics
+        stationary["KPSS"] = not (results["KPSS"][1] <= 0.05 and results["KPSS"][0] > results["KPSS"][3]["5%"])
 
         if verbose:
             print(f"Observations of KPSS Test ({feature})")
@@ -72,15 +118,17 @@ def checkStationarity(frame : object, feature: str, method : str = "both", verbo
             print(f"Critical Values : {critical_values}")
 
         # always print if data is stationary/not
-        print(f"[KPSS] Data is  :", "\x1b[31mNon-stationary\x1b[0m" if stationary else "\u001b[32mStationary\u001b[0m")
-
-    # rolling calculations for plotting
-    rolling = frame.copy() # enable deep copy
-    rolling = rolling[[feature]] # only keep single feature, works if multi-feature sent
-    rolling.rename(columns = {feature : "original"}, inplace = True)
-
-    rolling_ = rolling.rolling(window = kwargs.get("window", 12))
-    rolling["mean"] = rolling_.mean()["original"].values
-    rolling["std"] = rolling_.std()["original"].values
+        print(f"[KPSS] Data is  :", "\u001b[32mStationary\u001b[0m" if stationary["KPSS"] else "\x1b[31mNon-stationary\x1b[0m")
+
+    # rolling calculations for plotting, only the `feature` is used
+    # from the frame, works if multi-feature frame is sent, and both
+    # the statistics are calculated from a single rolling object
+    rolling_ = frame[feature].rolling(window = kwargs.get("window", 12))
+    mean_, std_ = rolling_.agg(["mean", "std"]).to_numpy().T
+
+    # ? the dataframe is created from the arrays, w/o inserting columns
+    rolling = pd.DataFrame({
+        "original" : frame[feature].array, "mean" : mean_, "std" : std_
+    }, index = frame.index)
 
     return results, stationary, rolling
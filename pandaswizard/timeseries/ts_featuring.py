@@ -18,6 +18,8 @@
 import numpy as np
 import pandas as pd
 
+from numpy.lib.stride_tricks import sliding_window_view
+
 
 class DataObjectModel(object):
     """
@@ -61,22 +63,35 @@ class DataObjectModel(object):
        # or if `y` is group of elements then:
        X, y = dom.create_xy(y_index = (1, 4))
        ```
+
+    :type  layout: str
+    :param layout: Memory layout of the data, either `aos` (default,
+                   row-major) or `soa` where the data is stored as
+                   column-major, i.e., each feature is a contiguous
+                   array, which is faster when the data is accessed
+                   per feature like `y` in :meth:`create_xy`.
     """
 
-    def __init__(self, data: np.ndarray) -> None:
+    def __init__(self, data: np.ndarray, layout : str = "aos") -> None:
+        assert layout in ["aos", "soa"], \
+            f"layout = {layout} is not valid, and/or not implemented."
+
         self.data = self.__to_numpy__(data)  # also check integrity
+        if layout == "soa":
+            # ? column-major array, `data[:, i]` is a contiguous view
+            self.data = np.asfortranarray(self.data)
 
     def __to_numpy__(self, data: object) -> np.ndarray:
         """Convert Meaningful Data into a N-Dimensional Array"""
 
-        if type(data) == np.ndarray:
+        if isinstance(data, np.ndarray):
             pass # data is already in required type
-        elif type(data) in [list, tuple]:
-            data = np.array(data)
-        elif type(data) == pd.DataFrame:
+        elif isinstance(data, (list, tuple)):
+            data = np.asarray(data)
+        elif isinstance(data, pd.DataFrame):
             # often times a full df can be passed, which is a ndarray
             # thus, the df can be easily converted to an np ndarray:
-            data = data.values
+            data = data.to_numpy(copy = False)
         else:
             raise TypeError(
                 f"Data `type == {type(data)}` is not convertible.")
@@ -92,8 +107,8 @@ def create_xy(self, y_index : object = -1) -> tuple:
         `y` along a given axis (`y_index`) and returns two `ndarray`
         which can be treated as `X` and `y` individually.
 
-        The function uses `np.delete` command to create `X` feature
-        from the data. (https://stackoverflow.com/a/5034558/6623589).
+        The function uses a boolean mask over the columns to create
+        `X` feature from the data, such that the data is copied once.
 
         This function is meant for multivariate dataset, and is only
         applicable when dealing with multivariate time series data.
@@ -110,17 +125,20 @@ def create_xy(self, y_index : object = -1) -> tuple:
                         end index is exclusive as in `numpy` module.
         """
 
+        # ? columns of `x` are selected using a boolean mask, in one copy
+        x_mask = np.ones(self.data.shape[1], dtype = bool)
+
         if type(y_index) in [list, tuple]:
-            x_ = self.data
             y_ = self.data[:, y_index[0]:y_index[1]]
-            for idx in range(*y_index)[::-1]:
-                x_ = np.delete(x_, obj = idx, axis = 1)
+            x_mask[y_index[0]:y_index[1]] = False
         elif type(y_index) == int:
             y_ = self.data[:, y_index]
-            x_ = np.delete(self.data, obj = y_index, axis = 1)
+            x_mask[y_index] = False
         else:
             raise TypeError("`type(y_index)` not in [int, tuple].")
 
+        x_ = self.data[:, x_mask]
+
         return x_, y_
 
 
@@ -134,10 +152,27 @@ class CreateSequence(DataObjectModel):
     length of output sequence. The function tries to provide single
     approach to break data into sequence of `x_train` and `y_train`
     for training in neural network.
+
+    :type  dtype: np.dtype
+    :param dtype: Data type of the sequences, defaults to `np.float32`
+                  which is consumed by most deep learning frameworks
+                  and halves the memory traffic of the windows. Only
+                  a floating point data is cast, use `dtype = None` to
+                  always keep the source data type.
     """
 
-    def __init__(self, data: np.ndarray) -> None:
-        super().__init__(data)
+    def __init__(
+        self,
+        data : np.ndarray,
+        layout : str = "aos",
+        dtype : np.dtype = np.float32
+    ) -> None:
+        super().__init__(data, layout = layout)
+
+        if dtype is not None and np.issubdtype(self.data.dtype, np.floating):
+            # ? cast once, all the windows are then views of `dtype`, the
+            # integer (like epoch) and object data are kept as is
+            self.data = self.data.astype(dtype, copy = False)
 
 
     def create_series(
@@ -164,25 +199,35 @@ def create_series(
         * 🛠 by default the last column (-1) of `data` is considered
           as `y` feature by slicing `arr[s:e, -1]` but this can be
           configured using `kwargs["y_feat_"]`
+        * ⚙️ the sequences are created using sliding window views, and
+          the views can be returned w/o copying using `copy = False`
+          (the returned arrays are then read-only).
         """
 
-        x_, y_ = [], []
         n_record = self.__check_univariate_get_len__(univariate) \
             - n_forecast + 1
+        n_samples = max(n_record - n_lookback, 0)
 
         y_feat_ = kwargs.get("y_feat_", -1)
 
-        for idx in range(n_lookback, n_record):
-            x_.append(self.data[idx - n_lookback : idx])
-            y_.append(
-                self.data[idx : idx + n_forecast] if univariate
-                else self.data[idx : idx + n_forecast, y_feat_]
-            )
+        if n_samples == 0:
+            # ? no complete sequence is available, nothing to slice
+            return [np.array([]), np.array([])]
 
-        x_, y_ = map(np.array, [x_, y_])
+        # ? the sequences are overlapping windows (views) of the data
+        # https://numpy.org/doc/stable/reference/generated/numpy.lib.stride_tricks.sliding_window_view.html
+        x_ = self.__windows__(self.data, n_lookback, 0, n_samples)
+        y_ = self.__windows__(
+            self.data if univariate else self.data[:, y_feat_],
+            n_forecast, n_lookback, n_samples
+        )
+
+        if kwargs.get("copy", True):
+            # ! the views are read-only and share memory between windows
+            x_, y_ = map(np.ascontiguousarray, [x_, y_])
 
         if univariate:
-            # the for loop is so designed it returns the data like:
+            # the windows are so designed it returns the data like:
             # (<records>, n_lookback, <features>) however,
             # for univariate the `<features>` dimension is "squeezed"
             x_, y_ = map(lambda arr : np.squeeze(arr), [x_, y_])
@@ -190,6 +235,21 @@ def create_series(
         return [x_, y_]
 
 
+    def __windows__(self, data : np.ndarray, size : int, start : int, n_samples : int) -> np.ndarray:
+        """
+        Returns `n_samples` Windows of Length `size` from the `start`
+        index as a view of shape `(n_samples, size, <features>)` on the
+        first axis of the data, i.e., `data[idx : idx + size]`.
+        """
+
+        windows = sliding_window_view(data, size, axis = 0)
+        if data.ndim > 1:
+            # ? the window dimension is the last, move next to records
+            windows = np.moveaxis(windows, -1, 1)
+
+        return windows[start : start + n_samples]
+
+
     def __check_univariate_get_len__(self, univariate : bool) -> int:
         """
         Check if the data is a univariate one, and if `True` then
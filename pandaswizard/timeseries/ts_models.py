@@ -13,8 +13,110 @@
 """
 
 import warnings
+import functools
 import numpy as np
 
+from typing import Union
+
+from pandaswizard.utils._njit import njit, NUMBA_AVAILABLE
+from pandaswizard.functions.collate import simpleMA
+
+
+@njit(cache = True, fastmath = True)
+def _simple_ma_kernel(series : np.ndarray, n_forecast : int) -> np.ndarray:
+    """
+    Rolling Simple Moving Average Forecast on a Ring Buffer
+
+    The window sum is updated in place, i.e., the latest forecast is
+    added and the oldest value is dropped from the running sum, thus
+    each forecast period is calculated in `O(1)` time. The kernel is
+    compiled using :mod:`numba` when available.
+    """
+
+    n_lookback = series.shape[0]
+    inv_lookback = 1.0 / n_lookback
+
+    buffer = series.copy() # ring buffer, oldest value at `head`
+    forecast = np.empty(n_forecast, dtype = np.float64)
+
+    # ! the forecast does not settle to a constant after `n_lookback`
+    # periods, the window then holds earlier (unequal) forecasts, thus
+    # each of the period is calculated using the recurrence relation
+    total, head = buffer.sum(), 0
+    for idx in range(n_forecast):
+        _iter_ma = total * inv_lookback
+        forecast[idx] = _iter_ma
+
+        # pop fifo, and add latest iter
+        total += _iter_ma - buffer[head]
+        buffer[head] = _iter_ma
+
+        head += 1
+        if head == n_lookback:
+            head = 0
+
+    return forecast
+
+
+@functools.lru_cache(maxsize = 128)
+def _ema_factors(alpha : float, n_lookback : int) -> np.ndarray:
+    """
+    Weights of Exponential Moving Average for the Lookback Period
+
+    The factors are `alpha / 2^i` for `i ∈ [1, n_lookback]` and are
+    cached for the repeated calls (like parameter sweeps) with the
+    same arguments, thus the returned array is read-only. The factors
+    are repeated, such that the weights for a ring buffer with oldest
+    value at `head` is the view `[n - head : 2n - head]` w/o a copy.
+    """
+
+    # ? `alpha * 2^-i` is exact, and computed in a single vectorized call
+    factors = np.ldexp(float(alpha), -np.arange(1, stop = n_lookback + 1, dtype = np.int32))
+    factors = np.concatenate((factors, factors))
+    factors.setflags(write = False)
+
+    return factors
+
+
+@njit(cache = True, fastmath = True)
+def _exponential_ma_kernel(series : np.ndarray, factors : np.ndarray, n_forecast : int) -> np.ndarray:
+    """
+    Rolling Exponential Moving Average Forecast on a Ring Buffer
+
+    The weighted sum is calculated in place on the ring buffer, i.e.,
+    the `factors` are applied from the oldest value at `head` w/o
+    shifting the buffer, which is split into two contiguous loops.
+    The kernel is compiled using :mod:`numba` when available.
+    """
+
+    n_lookback = series.shape[0]
+
+    buffer = series.copy() # ring buffer, oldest value at `head`
+    forecast = np.empty(n_forecast, dtype = np.float64)
+
+    # ! the weighted sum cannot be updated in `O(1)` from the previous
+    # sum, the older weights are doubled on each shift which also
+    # doubles the rounding error, thus the dot product is calculated
+    head = 0
+    for idx in range(n_forecast):
+        _iter_ma, tail = 0.0, n_lookback - head
+        for pos in range(tail):
+            _iter_ma += buffer[head + pos] * factors[pos]
+        for pos in range(head):
+            _iter_ma += buffer[pos] * factors[tail + pos]
+
+        forecast[idx] = _iter_ma
+
+        # pop fifo, and add latest iter
+        buffer[head] = _iter_ma
+
+        head += 1
+        if head == n_lookback:
+            head = 0
+
+    return forecast
+
+
 class MovingAverage:
     """
     A Set of Moving Average (MA) based Models for Time Series Methods
@@ -42,7 +144,7 @@ class MovingAverage:
         series = np.array([12, 7, 27, 34])
     ).simple()
 
-    >> np.array([20.00, 22.00, 25.75, 25.25, 23.00])
+    >> np.array([20.00, 22.00, 25.75, 25.4375, 23.296875])
     ```
 
     :type  n_lookback: int
@@ -61,7 +163,7 @@ class MovingAverage:
                    `N` is the value at current date.
     """
     
-    def __init__(self, n_lookback : int, n_forecast : int, series : np.ndarray) -> None:
+    def __init__(self, n_lookback : int, n_forecast : int, series : Union[list, np.ndarray]) -> None:
         self.n_lookback = n_lookback
         self.n_forecast = n_forecast
         
@@ -83,19 +185,12 @@ def simple(self) -> np.ndarray:
         is stationary.
         """
 
-        series_ = self.series.copy() # make a copy of the iterable
-        forecast = [] # append the forecasted values to the list
-
-        for _ in range(self.n_forecast):
-            _iter_ma = series_.mean()
-
-            # pop fifo, and add latest iter
-            series_ = np.insert(series_, len(series_), _iter_ma)
-            series_ = np.delete(series_, 0)
-
-            forecast.append(_iter_ma)
+        if self.n_forecast == 1:
+            # ? one period forecast is the mean of the lookback window
+            return simpleMA(self.series, self.n_lookback)
 
-        return np.array(forecast)
+        # ? the exact recurrence, runs as a python loop w/o numba
+        return _simple_ma_kernel(self.series, self.n_forecast)
 
 
     def exponential(self, alpha : float = 0.5) -> np.ndarray:
@@ -137,37 +232,49 @@ def exponential(self, alpha : float = 0.5) -> np.ndarray:
                       alpha ∈ (0, 1), typically the best value is 0.5
         """
 
-        series_ = self.series.copy() # make a copy of the iterable
-        forecast = [] # append the forecasted values to the list
-        
-        factors = alpha / (2 ** np.arange(1, stop = self.n_lookback + 1))
+        factors = _ema_factors(alpha, self.n_lookback)
+
+        if NUMBA_AVAILABLE:
+            return _exponential_ma_kernel(self.series, factors, self.n_forecast)
+
+        # ? w/o numba, each period is one `np.dot` of the ring buffer and
+        # the view of the (cached) factors, no allocation in the loop
+        buffer = self.series.copy() # ring buffer, oldest value at `head`
+        forecast = np.empty(self.n_forecast, dtype = np.float64)
 
-        for _ in range(self.n_forecast):
-            _iter_ma = (series_ * factors).sum()
+        # ? bind the lookups to locals, avoids attribute lookup in the loop
+        dot, n_lookback, head = np.dot, self.n_lookback, 0
+
+        for idx in range(self.n_forecast):
+            _iter_ma = dot(buffer, factors[n_lookback - head : 2 * n_lookback - head])
 
             # pop fifo, and add latest iter
-            series_ = np.insert(series_, len(series_), _iter_ma)
-            series_ = np.delete(series_, 0)
+            buffer[head] = _iter_ma
+            head = (head + 1) % n_lookback
 
-            forecast.append(_iter_ma)
+            forecast[idx] = _iter_ma
 
-        return np.array(forecast)
+        return forecast
 
 
-    def _check_series(self, series : list) -> list:
+    def _check_series(self, series : Union[list, np.ndarray]) -> np.ndarray:
         """
         Data Sanity Check on the `series` and Return Cleaned Series
 
         Checks if the series length is expected as the `lookback`
         period, else returns a truncated data series with a simple
-        warning.
+        warning. The series is always returned as a contiguous
+        `np.float64` array, such that the conversion is done once.
         """
 
-        if len(series) > self.n_lookback:
-            warnings.warn(f"Series Length = {len(series)}, while Lookback = {self.n_lookback} Periods.")
-            return series[-self.n_lookback :]
-        elif len(series) < self.n_lookback:
-            raise ValueError(f"Cannot compile, as {len(series)} < {self.n_lookback}. Check values.")
+        series = np.ascontiguousarray(series, dtype = np.float64)
+        assert series.ndim == 1, f"Expected an univariate series, got {series.ndim} dimensions."
+
+        if series.shape[0] > self.n_lookback:
+            warnings.warn(f"Series Length = {series.shape[0]}, while Lookback = {self.n_lookback} Periods.")
+            return series[-self.n_lookback :].copy() # ? does not keep the full series in memory
+        elif series.shape[0] < self.n_lookback:
+            raise ValueError(f"Cannot compile, as {series.shape[0]} < {self.n_lookback}. Check values.")
         else:
             return series
 
@@ -0,0 +1,9 @@
+# -*- encoding: utf-8 -*-
+
+"""
+Internal Utilities for the :mod:`pandaswizard` Module
+
+The utilities are not a part of the public API, and are used
+internally to provide optional functionalities (like compiling a
+function using :mod:`numba`) without adding hard dependencies.
+"""
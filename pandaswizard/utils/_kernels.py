@@ -0,0 +1,117 @@
+# -*- encoding: utf-8 -*-
+
+"""
+Compiled Kernels for the Grouped Calculations of :mod:`pandaswizard`
+
+The kernels are used by the `numba` engine of the functions defined
+in :mod:`pandaswizard.aggregate` and the `parallel` argument of the
+:func:`pandaswizard.window.groupApply` function. The module is only
+imported on first use, such that :mod:`numba` is not imported with
+the package or any of the submodules.
+"""
+
+import numpy as np
+
+from typing import Callable
+
+from pandaswizard.utils._njit import njit, prange, NUMBA_AVAILABLE # noqa: F401
+
+# ? interpolation method to an integer code, used by the compiled kernel
+METHOD_CODE = {
+    "linear" : 0,
+    "lower" : 1,
+    "higher" : 2,
+    "midpoint" : 3,
+    "nearest" : 4
+}
+
+
+@njit(cache = True)
+def _group_scatter_kernel(codes : np.ndarray, values : np.ndarray, starts : np.ndarray) -> np.ndarray:
+    """
+    Arrange the Values Contiguous to each Group using Counting Sort
+
+    The values of each group are placed from `starts[code]` in the
+    order of occurrence, i.e., same as a stable sort on the `codes`
+    but in `O(n)` time. The kernel is compiled using :mod:`numba`.
+    """
+
+    position = starts.copy()
+    retval = np.empty(values.shape[0], dtype = np.float64)
+
+    for idx in range(codes.shape[0]):
+        retval[position[codes[idx]]] = values[idx]
+        position[codes[idx]] += 1
+
+    return retval
+
+
+@njit(cache = True)
+def _group_quantile_kernel(
+        values : np.ndarray,
+        starts : np.ndarray,
+        counts : np.ndarray,
+        q : np.ndarray,
+        method_code : int
+    ) -> np.ndarray:
+    """
+    Calculate Quantile(s) for each Group of Values Sorted on Groups
+
+    The `values` are contiguous for each of the group (not sorted
+    within the group) and each of the group is sorted independently.
+    The kernel is compiled using :mod:`numba` when available.
+    """
+
+    retval = np.empty((counts.shape[0], q.shape[0]), dtype = np.float64)
+
+    for idx in range(counts.shape[0]):
+        count = counts[idx]
+        if count == 0:
+            retval[idx, :] = np.nan
+            continue
+
+        group = np.sort(values[starts[idx] : starts[idx] + count])
+        for jdx in range(q.shape[0]):
+            position = q[jdx] * (count - 1)
+            if method_code == 4:
+                position = np.rint(position) # ? round half to even
+
+            lower = int(np.floor(position))
+            gamma = position - lower
+
+            below = group[lower]
+            above = group[lower + 1] if gamma > 0 else below
+
+            if method_code == 0:
+                # ? linear interpolation, same as the `_lerp()` of numpy
+                if gamma >= 0.5:
+                    retval[idx, jdx] = above - (above - below) * (1 - gamma)
+                else:
+                    retval[idx, jdx] = below + (above - below) * gamma
+            elif method_code == 2:
+                retval[idx, jdx] = above
+            elif method_code == 3:
+                retval[idx, jdx] = (below + above) / 2
+            else:
+                retval[idx, jdx] = below
+
+    return retval
+
+
+@njit(parallel = True)
+def _group_apply_kernel(function : Callable, values : np.ndarray, bounds : np.ndarray) -> np.ndarray:
+    """
+    Apply a Compiled Function on each of the Group in Parallel
+
+    The `values` are sorted by the groups, such that the values of the
+    `i`-th group is the slice `values[bounds[i] : bounds[i + 1]]` and
+    the groups are independent, thus calculated in parallel. The rows
+    before the first group (i.e., missing keys) are set as `nan`.
+    """
+
+    retvals = np.full(values.shape[0], np.nan)
+    for group in prange(bounds.shape[0] - 1):
+        start, end = bounds[group], bounds[group + 1]
+        retvals[start : end] = function(values[start : end])
+
+    return retvals
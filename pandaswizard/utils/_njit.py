@@ -0,0 +1,26 @@
+# -*- encoding: utf-8 -*-
+
+"""
+Optional Just-in-Time Compilation of Numerical Kernels
+
+The :mod:`numba` module is not a requirement of the package, thus the
+:func:`njit` decorator gracefully falls back to an identity decorator
+when the module is not available and the function is executed as a
+pure python function. The decorator can be used both as ``@njit`` and
+``@njit(cache = True, ...)`` like the original decorator. Similarly,
+the :func:`prange` falls back to the built-in :func:`range` function.
+"""
+
+try:
+    from numba import njit, prange # noqa: F401
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        # ? called as `@njit` then the function is the only argument
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        return lambda func : func
@@ -13,8 +13,49 @@
 import numpy as np
 import pandas as pd
 
-from tqdm import tqdm as TQ
 from typing import Union, Callable, Iterable
+from numpy.lib.stride_tricks import sliding_window_view
+
+# ? numpy reductions mapped to the optimized methods of `Rolling` object
+# ! `ddof` of the numpy functions defaults to 0, while pandas uses 1
+__ROLLING_METHODS__ = {
+    np.mean : ("mean", {}),
+    np.sum : ("sum", {}),
+    np.std : ("std", {"ddof" : 0}),
+    np.var : ("var", {"ddof" : 0}),
+    np.min : ("min", {}),
+    np.max : ("max", {}),
+    np.median : ("median", {})
+}
+
+# ? unlike the other reductions, `np.median` of a series (as received by the
+# method of each window) does not dispatch to the pandas method, thus `nan`
+__ROLLING_NAN_PROPAGATE__ = (np.median, )
+
+# ? default arguments of `.rolling()`, check `_rolling()` for details
+__ROLLING_DEFAULTS__ = {
+    "min_periods" : None,
+    "center" : False,
+    "win_type" : None,
+    "closed" : None,
+    "step" : None
+}
+
+
+def _to_numpy(series : Union[pd.Series, np.ndarray]) -> np.ndarray:
+    """
+    Returns the Underlying Values of the Series as a `np.float64` Array
+
+    The missing values of the extension data types (like `Int64`) are
+    converted to `nan`, and a numpy array is returned as a contiguous
+    array which is not copied if already of the same data type.
+    """
+
+    if isinstance(series, pd.Series):
+        return series.to_numpy(dtype = np.float64, na_value = np.nan)
+
+    return np.ascontiguousarray(series, dtype = np.float64)
+
 
 def _rolling(series : pd.Series, window : Union[int, Callable], **kwargs):
     """
@@ -22,7 +63,7 @@ def _rolling(series : pd.Series, window : Union[int, Callable], **kwargs):
 
     The wrapper function accepts all the keyword arguments and returns
     only the arguments with their default value (or user-defined) to
-    the :attr:`rolling()` method.
+    the :attr:`rolling()` method, check `__ROLLING_DEFAULTS__`.
 
     Limitations: the wrapper function will work only with a data
     of type :attr:`pd.Series` and thus, does not supporr the :attr:`on`
@@ -34,22 +75,37 @@ def _rolling(series : pd.Series, window : Union[int, Callable], **kwargs):
         data["calculations"] = data["column"].apply(pdw.rolling(...))
     """
 
-    min_periods = kwargs.get("min_periods", None)
-    center = kwargs.get("center", False)
-    win_type = kwargs.get("win_type", None)
-    closed = kwargs.get("closed", None)
-    step = kwargs.get("step", None)
+    if not isinstance(series, pd.Series):
+        series = pd.Series(series) # ? an array does not have `.rolling()`
 
+    # ? only the arguments passed by the user are forwarded, others
+    # like `engine` are dropped and the defaults are set by pandas
     return series.rolling(
-        window,
-        min_periods = min_periods,
-        center = center,
-        win_type = win_type,
-        closed = closed,
-        step = step
+        window, **{key : kwargs[key] for key in __ROLLING_DEFAULTS__.keys() & kwargs.keys()}
     )
 
 
+def _partial_windows(n_record : int, window : int, **kwargs) -> np.ndarray:
+    """
+    Returns a Boolean Mask of the Windows not of the Window Length
+
+    The :func:`rolling` is calculated with `min_periods = 0` when not
+    defined by the user, such that the `nan` values are passed to the
+    method, and the windows w/o exactly `window` rows are masked.
+    For the default arguments these are the first `window - 1` rows,
+    else (like `center`, `closed`) the rows are counted by pandas.
+    """
+
+    if all(kwargs.get(key, value) is value for key, value in __ROLLING_DEFAULTS__.items() if key != "min_periods"):
+        mask = np.zeros(n_record, dtype = bool)
+        mask[: window - 1] = True
+        return mask
+
+    # ! the weights (`win_type`) are not used, only the rows are counted
+    kwargs = {**kwargs, "min_periods" : 0, "win_type" : None}
+    return _rolling(pd.Series(np.ones(n_record)), window, **kwargs).sum().to_numpy() != window
+
+
 def rolling(
         series : Union[pd.Series, np.ndarray],
         window : Union[int, Callable],
@@ -102,14 +158,102 @@ def rolling(
     :type  method: callable
     :param method: The aggregation method of the rolling series,
         which can be a simple function like :attr:`np.mean` or
-        can be any of the custom fancy functions.
+        can be any of the custom fancy functions. The numpy
+        reductions (like :attr:`np.mean`, :attr:`np.std`) are
+        calculated by the optimized methods of the rolling object,
+        while the custom function receives the window as an array.
+
+    For an integer :attr:`window` the method is calculated for each
+    window of length `window` (else `nan`), and the `nan` values of
+    the window are passed to the method, i.e., the reductions (like
+    :attr:`np.mean`, but not :attr:`np.median`) skip the `nan` values
+    as on a series and a custom function can use :attr:`np.nanmean`
+    and alike. The :attr:`min_periods` argument, when defined, follows
+    the :attr:`pandas` semantics, i.e., a partial window with at least
+    `min_periods` non-`nan` values is calculated. The same semantics
+    is also used for a custom function with `engine = "numba"`.
+
+    Keyword Arguments
+    -----------------
+        * **engine** (*str*): Execution engine of the custom function,
+            passed to :meth:`Rolling.apply`, i.e., use `numba` to
+            compile the function. Defaults to `cython` (pandas).
+
+        * **engine_kwargs** (*dict*): Passed to :meth:`Rolling.apply`
+            along with the :attr:`engine` argument.
+
+        * **vectorized** (*bool*): The :attr:`method` accepts the
+            `axis` argument (like :attr:`np.ptp`), and is called once
+            on a view of all the windows of shape `(n - window + 1,
+            window)` instead of each window. Only applicable for an
+            integer :attr:`window` with default rolling arguments, and
+            is ignored for the reductions (like :attr:`np.mean`) which
+            are faster using the rolling object. The `nan` values are
+            passed to the method as described above, thus the result
+            is same as w/o the argument.
     """
 
+    # ? an integer window w/o any other rolling arguments is calculated
+    # on the underlying array w/o creating the rolling object
+    fixed_window = isinstance(window, (int, np.integer)) and window > 0 \
+        and all(kwargs.get(key, value) is value for key, value in __ROLLING_DEFAULTS__.items())
+
+    # ? like the method on each window, the `nan` values are passed to
+    # the method (or skipped by the reductions) when `min_periods` is not
+    # defined, and only the windows of length `window` are calculated
+    # ! the method compiled by the `numba` engine cannot be wrapped, thus
+    # the windows with `nan` values are `nan` as per `min_periods` of pandas
+    partial = isinstance(window, (int, np.integer)) and kwargs.get("min_periods", None) is None \
+        and (method in __ROLLING_METHODS__ or kwargs.get("engine", None) != "numba")
+    if partial:
+        kwargs = {**kwargs, "min_periods" : 0}
+
+    if fixed_window and kwargs.get("vectorized", False) and method not in __ROLLING_METHODS__:
+        values = _to_numpy(series)
+        rolling_ = np.full(values.shape[0], np.nan)
+
+        if values.shape[0] >= window:
+            # ? view of the windows, the data is not copied for each window
+            # the same contract, i.e., all the windows (w/ `nan` values) of
+            # length `window` are passed to the method, and partial as `nan`
+            rolling_[window - 1 :] = method(sliding_window_view(values, window), axis = -1)
+
+        return rolling_
+
     rolling_ = _rolling(series, window, **kwargs) # rolling object
-    return [
-        method(array) if array.shape[0] == window
-        else np.nan for array in rolling_
-    ]
+
+    name = __ROLLING_METHODS__[method][0] if method in __ROLLING_METHODS__ else "apply"
+    if not hasattr(rolling_, name):
+        # ! a weighted window (`win_type`) only has the `mean`, `sum`, `var`
+        # and `std` methods, thus the method is called on each of the window
+        return np.array([
+            method(array) if array.shape[0] == window else np.nan
+            for array in rolling_
+        ], dtype = np.float64)
+
+    if method in __ROLLING_METHODS__:
+        _, kwargs_ = __ROLLING_METHODS__[method]
+        rolling_ = getattr(rolling_, name)(**kwargs_).to_numpy(copy = partial)
+
+        if partial and method in __ROLLING_NAN_PROPAGATE__:
+            isnan = pd.Series(np.isnan(_to_numpy(series)))
+            rolling_[_rolling(isnan, window, **kwargs).sum().to_numpy() > 0] = np.nan
+    else:
+        # ? the windows are passed as `np.ndarray` w/o the series overhead
+        # and the short windows (`min_periods = 0`) are never passed
+        method_ = (lambda array : method(array) if array.shape[0] == window else np.nan) \
+            if partial else method
+
+        rolling_ = rolling_.apply(
+            method_, raw = True,
+            engine = kwargs.get("engine", None),
+            engine_kwargs = kwargs.get("engine_kwargs", None)
+        ).to_numpy(copy = partial) # ! the array is masked (written) below
+
+    if partial:
+        rolling_[_partial_windows(len(series), window, **kwargs)] = np.nan
+
+    return rolling_
 
 
 def groupApply(
@@ -117,7 +261,9 @@ def groupApply(
         groupby : Iterable[str],
         feature : str,
         function : Callable,
-        outfeature : str = "values"
+        outfeature : str = "values",
+        verbose : bool = False,
+        parallel : bool = False
     ):
     """
     A Function to Dynamically Apply any Arbitary Function on a Group
@@ -152,14 +298,54 @@ def groupApply(
     :type  outfeature: str
     :param outfeature: Output feature/column name of the dataframe.
         Defaults to :attr:`values`.
-    """
-    groups = frame.copy().groupby(groupby) # DataFrameGroupBy object
 
-    retvals = []
-    for group in TQ(groups, desc = "groupApply()"):
-        _, frame_ = group # keys, dataframe object
+    :type  verbose: bool
+    :param verbose: Show a progress bar of the groups, which requires
+        the :mod:`tqdm` module. Defaults to :attr:`False`.
+
+    :type  parallel: bool
+    :param parallel: Apply the function on the groups in parallel,
+        which requires the function to be compiled using
+        :func:`numba.njit` and returns a numeric array, else the
+        argument is ignored. Defaults to :attr:`False`.
+    """
 
-        retvals += list(function(frame_[feature].values))
+    # ? values are sorted by the groups, and the boundaries are computed
+    # the group number of the missing keys is `nan`, which is set as -1
+    groups = frame.groupby(groupby, sort = False)
+    codes = groups.ngroup().to_numpy(dtype = np.float64, na_value = -1).astype(np.intp)
+    order = np.argsort(codes, kind = "stable") # ! missing keys are first
+
+    n_missing = np.count_nonzero(codes < 0)
+    bounds = np.full(groups.ngroups + 1, n_missing, dtype = np.intp)
+    bounds[1:] += np.cumsum(np.bincount(codes[codes >= 0], minlength = groups.ngroups))
+
+    # ? a compiled function has `py_func`, and thus numba is installed
+    if parallel and hasattr(function, "py_func"):
+        from pandaswizard.utils._kernels import _group_apply_kernel # ? imports numba
+
+        values = frame[feature].to_numpy(dtype = np.float64, na_value = np.nan)[order]
+        retvals_ = _group_apply_kernel(function, values, bounds)
+    else:
+        values = frame[feature].to_numpy()[order]
+
+        iterator = zip(bounds[:-1], bounds[1:])
+        if verbose:
+            # ? the module is only imported when the progress bar is required
+            from tqdm import tqdm as TQ
+            iterator = TQ(iterator, total = groups.ngroups, desc = "groupApply()")
+
+        # ? the function receives a slice of the sorted values, and the
+        # results are concatenated once, w/o boxing each of the value
+        retvals_ = [np.full(n_missing, np.nan)] if n_missing else []
+        for start, end in iterator:
+            retvals_.append(np.broadcast_to(function(values[start : end]), end - start))
+
+        retvals_ = np.concatenate(retvals_) if retvals_ else np.empty(0)
+
+    # ? the values are placed back in the order of the rows of the frame
+    retvals = np.empty_like(retvals_)
+    retvals[order] = retvals_
 
     frame[outfeature] = retvals
     return frame
@@ -9,7 +9,6 @@
 
 import time
 import functools
-import collections
 import pandas as pd
 
 def recordCounter(func : callable) -> callable:
@@ -57,15 +56,17 @@ def dropvals(frame):
     def _wrapper(*args, **kwargs) -> pd.DataFrame:
         print(f"Executed with @recordCounter[`{func.__name__}`]")
 
+        # ? explicit `None` check, `or` on a dataframe is ambiguous, and
+        # a missing keyword is not raised and caught on each of the call
+        __frame = args[0] if args else kwargs.get("data", None)
+        if __frame is None:
+            __frame = kwargs.get("frame", None)
+
         errors = False # lets initialize the decorator w/o error
-        try:
-            __frame = args[0] if args else \
-                kwargs.get("data", None) or kwargs["frame"]
-        except KeyError:
+        if __frame is None:
             errors = True
             print("  >> Failed to Execute. Check Decorator Limitation.")
-
-        if not errors and not isinstance(__frame, pd.DataFrame):
+        elif not isinstance(__frame, pd.DataFrame):
             errors = True
             print("  >> Failed to Execute. DF Object is Not Found.")
 
@@ -118,13 +119,14 @@ def timeit(func : callable) -> callable:
     def _wrapper(*args, **kwargs) -> pd.DataFrame:
         print(f"Executed with @timeit[`{func.__name__}`]")
 
-        start = time.process_time() # capture start time
+        # ? wall clock time, includes the i/o wait (like reading a file)
+        start = time.perf_counter() # capture start time
         frame = func(*args, **kwargs) # execute function
 
         # verbose information(s) to the output
-        process_time = time.process_time() - start
-        dtypes_count = collections.Counter(frame.dtypes.values)
-        print(f"  >> Function Executed in {process_time:,.3f} secs.")
+        elapsed_time = time.perf_counter() - start
+        dtypes_count = frame.dtypes.value_counts().to_dict()
+        print(f"  >> Function Executed in {elapsed_time:,.3f} secs.")
         print(f"  >> Fetched {frame.shape[0]:,} Record(s).")
         print(f"  >> No. of Feature(s)/Column(s) = {frame.shape[1]:,}.")
         print(f"  >> Observed Data Type(s) : {dtypes_count}")